@@ -10,17 +10,221 @@ import re
 import json
 import os
 import shutil
+import tempfile
+import logging
+import queue
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
-from datetime import datetime
+from urllib.parse import urlsplit
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from functools import lru_cache
+from lxml import html as lxml_html
 from selenium import webdriver
-from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
+
+from linkedin_url_collector import TRACKER_URL_PATTERNS, to_cdp_cookie
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson  # Optional: much faster JSON serialization
+except ImportError:
+    orjson = None
+
+# Validator patterns, compiled once at import
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# Filename cleanup patterns, compiled once at import
+_FILENAME_RESERVED_RE = re.compile(r'[<>:"/\\|?*]')
+_FILENAME_UNSAFE_RE = re.compile(r"[^\w\s-]")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# One reusable HTML parser for locally parsed DOM snapshots
+_HTML_PARSER = lxml_html.HTMLParser(remove_comments=True)
+
+# Substrings that disqualify a link from being a personal website
+_SKIP_URL_RE = re.compile(r'mailto:|tel:|javascript:|linkedin\.com/', re.IGNORECASE)
+
+# Requests that never carry content we extract - blocked via CDP
+_BLOCKED_URL_PATTERNS = TRACKER_URL_PATTERNS + [
+    # Web fonts and post videos only affect presentation; text extraction never needs them
+    "*.woff*",
+    "*.ttf*",
+    "*.mp4*",
+]
+
+
+def _node_text(node):
+    """Whitespace-normalized text of an lxml node, like Selenium's element.text"""
+    return " ".join(node.text_content().split())
+
+
+def _read_json(path):
+    """Load a JSON file, using orjson when it is installed"""
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _write_json(path, data):
+    """Write data as indented UTF-8 JSON, using orjson when it is installed
+    
+    The file is written next to its destination and renamed into place, so an
+    interrupted run never leaves a truncated JSON behind.
+    """
+    tmp_path = Path(f"{path}.tmp")
+    if orjson is not None:
+        with open(tmp_path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+class DriverPool:
+    """Fixed-size pool of headless browsers reused across profiles"""
+
+    def __init__(self, factory, size=1, max_uses=25, on_discard=None):
+        self.factory = factory
+        self.on_discard = on_discard  # Called with each browser after it quits
+        self.size = size
+        self.max_uses = max_uses  # Recycle after this many profiles to cap Chrome memory growth
+        self._idle = queue.Queue()
+        self._uses = {}
+        self._created = 0
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Borrow an idle browser, launching a new one while under capacity
+        
+        Returns None once the pool has been closed.
+        """
+        while True:
+            try:
+                return self._idle.get_nowait()
+            except queue.Empty:
+                pass
+
+            with self._lock:
+                if self._closed:
+                    return None
+                can_create = self._created < self.size
+                if can_create:
+                    self._created += 1
+
+            if can_create:
+                driver = self.factory()
+                if driver is None:
+                    with self._lock:
+                        self._created -= 1
+                return driver
+
+            # Pool is full - wait for a browser to come back (or a slot to free up)
+            try:
+                return self._idle.get(timeout=1)
+            except queue.Empty:
+                continue
+
+    def release(self, driver, broken=False):
+        """Return a browser to the pool, replacing it if broken or worn out"""
+        uses = self._uses.get(driver, 0) + 1
+        with self._lock:
+            keep = not (broken or self._closed or uses >= self.max_uses)
+            if keep:
+                self._uses[driver] = uses
+                self._idle.put(driver)
+        if not keep:
+            self._discard(driver)
+
+    def close_all(self):
+        """Quit every idle browser; browsers still in use are quit when released"""
+        with self._lock:
+            self._closed = True
+        while True:
+            try:
+                self._discard(self._idle.get_nowait())
+            except queue.Empty:
+                break
+
+    def _discard(self, driver):
+        self._uses.pop(driver, None)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        if self.on_discard:
+            self.on_discard(driver)
+        with self._lock:
+            self._created -= 1
+
+
+@dataclass
+class ExtractionStats:
+    """Counters for one extraction run"""
+    total_profiles: int = 0
+    processed_profiles: int = 0
+    successful_extractions: int = 0
+    failed_extractions: int = 0
+    skipped_profiles: int = 0
+    pending_profiles: int = 0  # total_profiles minus those extracted by earlier runs
+    start_time: datetime = field(default_factory=datetime.now)
+    # Elapsed time is measured on the monotonic clock so NTP adjustments can't skew it
+    start_monotonic: float = field(default_factory=time.monotonic)
+
 
 class ProductionInfoExtractor:
+    # Contact info button candidates as (name, selector), in priority order
+    CONTACT_BUTTON_SELECTORS = (
+        ('CSS ID', '#top-card-text-details-contact-info'),
+        ('CSS Class', 'a.link-without-visited-state'),
+        ('CSS Href', 'a[href*="contact-info"]'),
+    )
+    
+    # Only present once LinkedIn has client-rendered the profile's top card
+    TOP_CARD_SELECTOR = '#top-card-text-details-contact-info, h1.text-heading-xlarge'
+    
+    # Any of these means the contact info modal is on screen
+    MODAL_SELECTOR = 'div[role="dialog"], .artdeco-modal, .pv-contact-info'
+    
+    # Modal sections holding a plain-text email/phone when there is no mailto:/tel: link
+    # (XPath forms of "section:nth-child(4) div a", "section:last-child div a", ...)
+    EMAIL_TEXT_XPATHS = (
+        ".//section[count(preceding-sibling::*) = 3]//div//a",
+        ".//section[not(following-sibling::*)]//div//a"
+    )
+    PHONE_TEXT_XPATHS = (
+        ".//section[count(preceding-sibling::*) = 2]//ul//li//span",
+        ".//section[count(preceding-sibling::*) = 2]//ul//li",
+        ".//section//div//ul//li//span"
+    )
+    
+    # Modal close buttons, in priority order
+    CLOSE_BUTTON_SELECTORS = (
+        "button[aria-label*='Dismiss']",
+        "button[aria-label*='Close']",
+        ".artdeco-modal__dismiss",
+        "button.artdeco-button--circle"
+    )
+    
+    # Seconds between browser -> requests cookie syncs (auth cookies are stable within a run)
+    COOKIE_SYNC_INTERVAL = 300
+    
+    # Minimum seconds between profile starts across all workers (keeps parallel runs polite)
+    PROFILE_START_INTERVAL = 2.0
+
     def __init__(self, output_dir="scraped_data"):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
@@ -30,20 +234,43 @@ class ProductionInfoExtractor:
         self.profile_links_file = self.url_collector_dir / "profile_links.json"
         self.cookies_file = self.url_collector_dir / "cookies.json"
         
-        # WSL Downloads directory
-        self.downloads_dir = Path.home() / "Downloads"
+        # Persistent Chrome profile for the visible login browser (shared with URL collector)
+        self.chrome_profile_dir = Path.home() / ".linkedin_scraper_profile"
+        
+        # On-disk HTTP/code cache for the headless browsers (cookies stay ephemeral)
+        self.browser_cache_dir = Path.home() / ".linkedin_scraper_cache" / "extractor"
+        
+        # Profiles finished by earlier runs (profile URL -> folder name), so reruns skip them
+        self.seen_file = self.output_dir / ".seen.json"
+        self.seen_profiles = self._load_seen_profiles()
         
         # Get next folder number
         self.next_folder_number = self._get_next_folder_number()
         
+        # Guards folder numbering and stats when profiles run in parallel
+        self._lock = threading.Lock()
+        
+        # Headless browsers shared across profiles (created in run_production_extraction)
+        self.driver_pool = None
+        
+        # Private download directory of each headless browser, so parallel PDF downloads never mix
+        self._download_dirs = {}
+        
+        # Background HTTP downloads overlapped with browser work (created in run_production_extraction)
+        self.download_executor = None
+        
+        # Per-thread requests session, kept across profiles and re-synced incrementally
+        self._local = threading.local()
+        
+        # Earliest monotonic time the next profile may start (see _wait_for_start_slot)
+        self._next_start = 0.0
+        
+        # Selectors that worked last time - LinkedIn's DOM is stable within a run
+        self._last_contact_selector = None
+        self._last_close_selector = None
+        
         # Processing stats
-        self.stats = {
-            'total_profiles': 0,
-            'processed_profiles': 0,
-            'successful_extractions': 0,
-            'failed_extractions': 0,
-            'start_time': datetime.now()
-        }
+        self.stats = ExtractionStats()
         
     def check_cookies(self):
         """Check if cookies file exists and is valid"""
@@ -52,8 +279,7 @@ class ProductionInfoExtractor:
                 print("❌ No cookies file found")
                 return False
                 
-            with open(self.cookies_file, 'r') as f:
-                cookie_data = json.load(f)
+            cookie_data = _read_json(self.cookies_file)
                 
             if 'cookies' in cookie_data and 'user_agent' in cookie_data:
                 timestamp = cookie_data.get('timestamp')
@@ -84,21 +310,25 @@ class ProductionInfoExtractor:
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option('useAutomationExtension', False)
         
+        # Reuse the saved browser profile so an earlier login (and HTTP cache) survives
+        options.add_argument(f'--user-data-dir={self.chrome_profile_dir}')
+        options.add_argument('--profile-directory=Default')
+        
         service = Service("./chromedriver")
         driver = webdriver.Chrome(service=service, options=options)
         driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
         
         try:
             print("🌐 Opening LinkedIn for login...")
-            driver.get("https://www.linkedin.com")
-            time.sleep(2)
-            
-            print("\n" + "="*60)
-            print("⏳ PLEASE LOG IN TO LINKEDIN")
-            print("="*60)
-            print("🔐 1. Complete LinkedIn login")
-            print("✅ 2. Press ENTER when logged in and ready...")
-            input()
+            if self._is_logged_in(driver):
+                print("✅ Already logged in from saved browser profile - skipping manual login")
+            else:
+                print("\n" + "="*60)
+                print("⏳ PLEASE LOG IN TO LINKEDIN")
+                print("="*60)
+                print("🔐 1. Complete LinkedIn login")
+                print("✅ 2. Press ENTER when logged in and ready...")
+                input()
             
             # Extract cookies
             print("🍪 Extracting cookies...")
@@ -113,8 +343,7 @@ class ProductionInfoExtractor:
                 'user_agent': driver.execute_script("return navigator.userAgent;")
             }
             
-            with open(self.cookies_file, 'w') as f:
-                json.dump(cookie_data, f, indent=2)
+            _write_json(self.cookies_file, cookie_data)
                 
             print(f"✅ Cookies saved to {self.cookies_file}")
             return True
@@ -126,14 +355,22 @@ class ProductionInfoExtractor:
             driver.quit()
             print("🔒 Browser closed")
             
+    def _is_logged_in(self, driver):
+        """Check whether the browser already holds a LinkedIn session"""
+        try:
+            # Logged-out visitors get redirected from the feed to login/authwall
+            driver.get("https://www.linkedin.com/feed/")
+            return "/feed" in driver.current_url
+        except Exception:
+            return False
+            
     def setup_headless_browser(self):
         """Setup headless browser with cookies"""
         try:
             if not self.cookies_file.exists():
                 raise Exception("Cookies file not found")
                 
-            with open(self.cookies_file, 'r') as f:
-                cookie_data = json.load(f)
+            cookie_data = _read_json(self.cookies_file)
                 
             # Setup headless browser
             options = ChromeOptions()
@@ -146,30 +383,61 @@ class ProductionInfoExtractor:
             options.add_experimental_option("excludeSwitches", ["enable-automation"])
             options.add_experimental_option('useAutomationExtension', False)
             
-            # Downloads preferences
+            # Skip image decoding - we only read <img> src attributes, never pixels
+            options.add_argument('--blink-settings=imagesEnabled=false')
+            
+            # Return from driver.get() on DOMContentLoaded; readiness is handled by explicit waits
+            options.set_capability('pageLoadStrategy', 'eager')
+            
+            # Downloads and content preferences
+            download_dir = Path(tempfile.mkdtemp(prefix="linkedin_pdf_"))
             prefs = {
-                "download.default_directory": str(self.downloads_dir),
+                "download.default_directory": str(download_dir),
                 "download.prompt_for_download": False,
                 "download.directory_upgrade": True,
                 "plugins.always_open_pdf_externally": True,
                 "safebrowsing.enabled": True,
+                "profile.managed_default_content_settings.images": 2,
+                "profile.default_content_setting_values.notifications": 2,
             }
             options.add_experimental_option("prefs", prefs)
             
+            # Keep LinkedIn's JS/CSS cached between runs. Chrome can't share a cache
+            # directory between live processes, so only a single-browser pool uses it.
+            if self.driver_pool is None or self.driver_pool.size == 1:
+                options.add_argument(f'--disk-cache-dir={self.browser_cache_dir}')
+                options.add_argument('--disk-cache-size=536870912')
+            
             service = Service("./chromedriver")
-            driver = webdriver.Chrome(service=service, options=options)
+            try:
+                driver = webdriver.Chrome(service=service, options=options)
+            except Exception:
+                shutil.rmtree(download_dir, ignore_errors=True)
+                raise
+            self._download_dirs[driver] = download_dir
+            driver.implicitly_wait(0)
             driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
             
-            # Navigate to LinkedIn first
-            driver.get("https://www.linkedin.com")
-            time.sleep(1)
+            # Drop tracking requests before they reach the network
+            try:
+                driver.execute_cdp_cmd('Network.enable', {})
+                driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': _BLOCKED_URL_PATTERNS})
+            except Exception as e:
+                logger.debug("Could not block tracking URLs: %s", e)
             
-            # Add cookies
-            for cookie in cookie_data['cookies']:
-                try:
-                    driver.add_cookie(cookie)
-                except Exception:
-                    continue
+            # Set every cookie in one CDP call - no need to load linkedin.com first
+            try:
+                driver.execute_cdp_cmd('Network.setCookies', {
+                    'cookies': [to_cdp_cookie(c) for c in cookie_data['cookies']]
+                })
+            except Exception as e:
+                logger.debug("CDP cookie import failed, falling back to add_cookie: %s", e)
+                driver.get("https://www.linkedin.com")
+                for cookie in cookie_data['cookies']:
+                    try:
+                        driver.add_cookie(cookie)
+                    except Exception:
+                        continue
                     
             return driver
             
@@ -178,41 +446,98 @@ class ProductionInfoExtractor:
             return None
             
     def setup_requests_session(self, driver):
-        """Setup requests session with cookies from browser"""
-        session = requests.Session()
-        session.headers.update({
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.5",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1",
-        })
-        
-        # Sync cookies from browser
-        session.cookies.clear()
-        for cookie in driver.get_cookies():
-            session.cookies.set(
-                cookie["name"],
-                cookie["value"],
-                domain=cookie.get("domain", ".linkedin.com"),
-            )
+        """Return this thread's requests session with cookies synced from the browser"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update({
+                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+                "Accept-Language": "en-US,en;q=0.5",
+                "Accept-Encoding": "gzip, deflate, br",
+                "Connection": "keep-alive",
+                "Upgrade-Insecure-Requests": "1",
+            })
             
+            # Keep-alive pool for the image CDN, with backoff when LinkedIn throttles
+            retries = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 503])
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retries)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            
+            # Force a fresh cookie sync as soon as the CDN rejects our credentials
+            sync_state = {'cookies': {}, 'synced_at': None}
+            def expire_cookies_on_auth_error(response, *args, **kwargs):
+                if response.status_code in (401, 403):
+                    sync_state['synced_at'] = None
+            session.hooks['response'].append(expire_cookies_on_auth_error)
+            
+            self._local.session = session
+            self._local.cookie_sync = sync_state
+            
+        self._sync_cookies(session, driver)
         return session
+        
+    def _sync_cookies(self, session, driver):
+        """Copy only new or changed browser cookies into the session"""
+        state = self._local.cookie_sync
+        now = time.monotonic()
+        if state['synced_at'] is not None and now - state['synced_at'] < self.COOKIE_SYNC_INTERVAL:
+            return
+            
+        synced = state['cookies']
+        current = {
+            (cookie["name"], cookie.get("domain", ".linkedin.com")): cookie["value"]
+            for cookie in driver.get_cookies()
+        }
+        state['synced_at'] = now
+        if current == synced:
+            return
+            
+        # The jar is not safe to mutate while the previous profile's picture download uses it
+        pending = getattr(self._local, 'pending_download', None)
+        if pending is not None:
+            wait([pending])
+            self._local.pending_download = None
+            
+        for (name, domain), value in current.items():
+            if synced.get((name, domain)) != value:
+                session.cookies.set(name, value, domain=domain)
+                
+        # Setting None removes the cookie from the jar
+        for name, domain in synced.keys() - current.keys():
+            session.cookies.set(name, None, domain=domain)
+            
+        state['cookies'] = current
+
+    def _load_seen_profiles(self):
+        """Load the profile URLs extracted by earlier runs"""
+        try:
+            if self.seen_file.exists():
+                seen = _read_json(self.seen_file)
+                print(f"📂 {len(seen)} profiles already extracted - they will be skipped")
+                return seen
+        except Exception as e:
+            print(f"⚠️ Could not read {self.seen_file}: {e}")
+        return {}
+
+    def _mark_seen(self, profile_url, folder_name):
+        """Record a finished profile and persist the index atomically"""
+        with self._lock:
+            self.seen_profiles[profile_url] = folder_name
+            _write_json(self.seen_file, self.seen_profiles)
 
     def _get_next_folder_number(self):
         """Find the highest existing folder number and return the next one"""
         try:
-            existing_folders = [d for d in self.output_dir.iterdir() if d.is_dir()]
             max_number = 0
 
-            for folder in existing_folders:
-                folder_name = folder.name
-                if "_" in folder_name:
-                    first_part = folder_name.split("_")[0]
-                    if first_part.isdigit():
-                        number = int(first_part)
-                        max_number = max(max_number, number)
+            # Single directory pass; DirEntry.is_dir() reuses the type from the listing
+            with os.scandir(self.output_dir) as entries:
+                for entry in entries:
+                    first_part, sep, _ = entry.name.partition("_")
+                    if sep and first_part.isdigit() and entry.is_dir(follow_symlinks=False):
+                        max_number = max(max_number, int(first_part))
 
             next_number = max_number + 1
             print(f"📊 Starting folder number: {next_number}")
@@ -224,9 +549,9 @@ class ProductionInfoExtractor:
 
     def _clean_filename(self, name):
         """Clean name for safe folder/filename"""
-        clean = re.sub(r'[<>:"/\\|?*]', "_", name.strip())
-        clean = re.sub(r"[^\w\s-]", "", clean)
-        clean = re.sub(r"\s+", "_", clean)
+        clean = _FILENAME_RESERVED_RE.sub("_", name.strip())
+        clean = _FILENAME_UNSAFE_RE.sub("", clean)
+        clean = _WHITESPACE_RE.sub("_", clean)
         return clean[:50]
 
     def _extract_profile_info(self, driver, profile_url):
@@ -263,17 +588,6 @@ class ProductionInfoExtractor:
                 ".update-components-actor__title span[aria-hidden='true']"
             ]
 
-            for selector in name_selectors:
-                try:
-                    element = driver.find_element(By.CSS_SELECTOR, selector)
-                    name = element.text.strip()
-                    if name and len(name) > 2:
-                        profile_info["name"] = name
-                        profile_info["clean_filename"] = self._clean_filename(name)
-                        break
-                except:
-                    continue
-            
             # Extract title/headline
             title_selectors = [
                 ".text-body-medium.break-words",
@@ -281,16 +595,6 @@ class ProductionInfoExtractor:
                 ".update-components-actor__description"
             ]
             
-            for selector in title_selectors:
-                try:
-                    element = driver.find_element(By.CSS_SELECTOR, selector)
-                    title = element.text.strip()
-                    if title and len(title) > 5:
-                        profile_info["title"] = title
-                        break
-                except:
-                    continue
-            
             # Extract profile picture URL
             img_selectors = [
                 "img.pv-top-card-profile-picture__image--show",
@@ -298,31 +602,49 @@ class ProductionInfoExtractor:
                 "img[alt*='profile']",
                 ".update-components-actor__avatar img"
             ]
-
-            for selector in img_selectors:
-                try:
-                    element = driver.find_element(By.CSS_SELECTOR, selector)
-                    if element.is_displayed():
-                        src = element.get_attribute("src")
-                        if src and ("profile" in src or "displayphoto" in src):
-                            profile_info["profile_picture_url"] = src
-                            break
-                except:
-                    continue
+            
+            # Read the first match of every selector plus the badges in one round trip
+            header = driver.execute_script("""
+                function first(selectors) {
+                    return selectors.map(function(selector) { return document.querySelector(selector); });
+                }
+                function text(e) { return e ? (e.innerText || '').trim() : null; }
+                return {
+                    names: first(arguments[0]).map(text),
+                    titles: first(arguments[1]).map(text),
+                    images: first(arguments[2]).map(function(e) {
+                        return e ? {
+                            src: e.src || null,
+                            visible: !!(e.offsetWidth || e.offsetHeight || e.getClientRects().length)
+                        } : null;
+                    }),
+                    verified: !!document.querySelector(arguments[3]),
+                    premium: !!document.querySelector(arguments[4])
+                };
+            """, name_selectors, title_selectors, img_selectors,
+                "svg[data-test-icon='verified-small'], .text-view-model__verified-icon",
+                "svg[data-test-icon*='premium'], .text-view-model__linkedin-bug-premium") or {}
+            
+            for name in header.get('names', []):
+                if name and len(name) > 2:
+                    profile_info["name"] = name
+                    profile_info["clean_filename"] = self._clean_filename(name)
+                    break
+            
+            for title in header.get('titles', []):
+                if title and len(title) > 5:
+                    profile_info["title"] = title
+                    break
+            
+            for image in header.get('images', []):
+                src = image and image['src']
+                if src and ("profile" in src or "displayphoto" in src) and image['visible']:
+                    profile_info["profile_picture_url"] = src
+                    break
             
             # Check for verification/premium badges
-            try:
-                verified_elements = driver.find_elements(By.CSS_SELECTOR, 
-                    "svg[data-test-icon='verified-small'], .text-view-model__verified-icon")
-                if verified_elements:
-                    profile_info["verified"] = True
-                    
-                premium_elements = driver.find_elements(By.CSS_SELECTOR,
-                    "svg[data-test-icon*='premium'], .text-view-model__linkedin-bug-premium")
-                if premium_elements:
-                    profile_info["premium"] = True
-            except:
-                pass
+            profile_info["verified"] = header.get('verified', False)
+            profile_info["premium"] = header.get('premium', False)
                 
             print(f"👤 Profile Info: {profile_info['name']} - {profile_info['title']}")
             return profile_info
@@ -336,8 +658,7 @@ class ProductionInfoExtractor:
         try:
             if not email or len(email) < 5:
                 return False
-            pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-            return re.match(pattern, email) is not None
+            return _EMAIL_RE.match(email) is not None
         except:
             return False
         
@@ -346,74 +667,98 @@ class ProductionInfoExtractor:
         try:
             if not phone:
                 return False
-            clean_phone = re.sub(r'[^\d+\-\(\)\s]', '', phone)
-            digits = re.findall(r'\d', clean_phone)
-            return len(digits) >= 7
+            # Only the digit count matters; stop as soon as we have enough
+            count = 0
+            for c in phone:
+                if c.isdigit():
+                    count += 1
+                    if count >= 7:
+                        return True
+            return False
         except:
             return False
         
-    def _is_valid_website(self, url):
-        """Validate website URL format"""
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _is_valid_website(url):
+        """Validate website URL format (pure, so results are memoized across profiles)"""
         try:
             if not url or len(url) < 10:
                 return False
-            if not url.lower().startswith(('http://', 'https://')):
+            lower_url = url.lower()
+            if not lower_url.startswith(('http://', 'https://')):
                 return False
             if '.' not in url:
                 return False
             
-            skip_patterns = [
-                'mailto:', 
-                'tel:', 
-                'javascript:', 
-                'linkedin.com/',
-                'www.linkedin.com/'
-            ]
-            
-            for pattern in skip_patterns:
-                if pattern in url.lower():
-                    return False
-            return True
+            return _SKIP_URL_RE.search(url) is None
         except Exception:
             return False
     
+    def _wait_for_page(self, driver, selector, timeout=10, may_be_empty=False):
+        """Wait until selector matches; returns False if the page never got there
+        
+        With may_be_empty, a page that finishes loading without a match also counts
+        as ready (e.g. an activity feed with no posts).
+        """
+        try:
+            WebDriverWait(driver, timeout, poll_frequency=0.25).until(lambda d: d.execute_script(
+                "return !!document.querySelector(arguments[0]) ||"
+                " (arguments[1] && document.readyState === 'complete');",
+                selector, may_be_empty
+            ))
+            return True
+        except TimeoutException:
+            logger.debug("Page not ready after %ss: %s", timeout, selector)
+            return False
+    
+    def _probe_elements(self, driver, selectors):
+        """Return element, visibility, enabled state, text, href and src for all matches in one round trip
+        
+        Accepts a single selector or a sequence of them. Matches come back grouped in
+        selector order (document order within each), so callers keep their priority.
+        """
+        if isinstance(selectors, str):
+            selectors = [selectors]
+        return driver.execute_script("""
+            var out = [];
+            arguments[0].forEach(function(selector) {
+                document.querySelectorAll(selector).forEach(function(e) {
+                    out.push({
+                        selector: selector,
+                        element: e,
+                        visible: !!(e.offsetWidth || e.offsetHeight || e.getClientRects().length),
+                        enabled: !e.disabled,
+                        text: (e.innerText || '').trim(),
+                        href: e.href || null,
+                        src: e.src || null
+                    });
+                });
+            });
+            return out;
+        """, list(selectors)) or []
+    
     def find_contact_button(self, driver):
         """Find contact info button"""
-        contact_selectors = [
-            {
-                'name': 'CSS ID',
-                'method': By.CSS_SELECTOR,
-                'selector': '#top-card-text-details-contact-info'
-            },
-            {
-                'name': 'CSS Class',
-                'method': By.CSS_SELECTOR,
-                'selector': 'a.link-without-visited-state'
-            },
-            {
-                'name': 'CSS Href', 
-                'method': By.CSS_SELECTOR,
-                'selector': 'a[href*="contact-info"]'
-            }
-        ]
+        # Try the selector that worked on the previous profile first
+        contact_selectors = sorted(
+            self.CONTACT_BUTTON_SELECTORS, key=lambda s: s[0] != self._last_contact_selector
+        )
         
-        for selector_info in contact_selectors:
-            try:
-                print(f"🔍 Trying: {selector_info['name']}")
-                
-                elements = driver.find_elements(selector_info['method'], selector_info['selector'])
-                
-                for element in elements:
-                    try:
-                        if element.is_displayed() and element.is_enabled():
-                            print(f"✅ Found contact button: {selector_info['name']}")
-                            return element, selector_info['name']
-                    except Exception:
-                        continue
-                        
-            except Exception as e:
-                print(f"❌ Selector failed: {e}")
-                continue
+        names = {selector: name for name, selector in contact_selectors}
+        try:
+            logger.debug("🔍 Trying: %s", ", ".join(names.values()))
+            
+            # Every candidate selector is checked in a single round trip
+            for probe in self._probe_elements(driver, list(names)):
+                if probe['visible'] and probe['enabled']:
+                    name = names[probe['selector']]
+                    print(f"✅ Found contact button: {name}")
+                    self._last_contact_selector = name
+                    return probe['element'], name
+                    
+        except Exception as e:
+            logger.debug("❌ Selector failed: %s", e)
         
         return None, None
     
@@ -427,97 +772,82 @@ class ProductionInfoExtractor:
         }
         
         print("📞 Extracting contact information...")
-        time.sleep(3)
+        try:
+            WebDriverWait(driver, 10, poll_frequency=0.25).until(self._is_modal_visible)
+        except TimeoutException:
+            print("⚠️ Modal not visible after 10s - extracting anyway")
         
-        # EMAIL EXTRACTION
-        email_selectors = [
-            "a[href*='mailto:']",
-            "section div a[href*='mailto']", 
-            "section:nth-child(4) div a",
-            "section:last-child div a"
-        ]
+        # Fetch the first *visible* modal's DOM in one round trip and parse it locally
+        # (same visibility test as _is_modal_visible - a hidden dialog may come earlier)
+        modal_html = driver.execute_script("""
+            var m = Array.prototype.find.call(document.querySelectorAll(arguments[0]), function(e) {
+                return !!(e.offsetWidth || e.offsetHeight || e.getClientRects().length);
+            });
+            return m ? m.outerHTML : '';
+        """, self.MODAL_SELECTOR)
+        if not modal_html:
+            print("⚠️ Modal content not found")
+            return contact_data
+        modal = lxml_html.fromstring(modal_html, parser=_HTML_PARSER)
         
-        for i, selector in enumerate(email_selectors):
+        # LINK EXTRACTION - classify every link in a single sweep
+        seen_urls = set()
+        for link in modal.xpath('.//a[@href]'):
             try:
-                elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                for element in elements:
-                    href = element.get_attribute('href')
-                    text = element.text.strip()
-                    
-                    if href and 'mailto:' in href:
-                        email = href.replace('mailto:', '').strip()
-                        if self._is_valid_email(email):
-                            contact_data['email'] = email
-                            print(f"📧 EMAIL FOUND: {email}")
-                            break
-                    elif text and '@' in text and self._is_valid_email(text):
-                        contact_data['email'] = text
-                        print(f"📧 EMAIL FOUND: {text}")
-                        break
-                        
-                if contact_data['email']:
-                    break
+                href = link.get('href').strip()
+                
+                if 'mailto:' in href:
+                    email = href.replace('mailto:', '').strip()
+                    if not contact_data['email'] and self._is_valid_email(email):
+                        contact_data['email'] = email
+                        print(f"📧 EMAIL FOUND: {email}")
+                elif 'tel:' in href:
+                    phone = href.replace('tel:', '').strip()
+                    if not contact_data['phone'] and self._is_valid_phone(phone):
+                        contact_data['phone'] = phone
+                        print(f"📱 PHONE FOUND: {phone}")
+                elif href not in seen_urls and self._is_valid_website(href):
+                    seen_urls.add(href)
+                    text = _node_text(link)
+                    contact_data['websites'].append({
+                        'url': href,
+                        'display_text': text if text else href
+                    })
+                    print(f"🌐 WEBSITE FOUND: {href}")
             except Exception:
                 continue
         
-        # PHONE EXTRACTION
-        phone_selectors = [
-            "a[href*='tel:']",
-            "section:nth-child(3) ul li span",
-            "section:nth-child(3) ul li", 
-            "section div ul li span"
-        ]
-        
-        for i, selector in enumerate(phone_selectors):
-            try:
-                elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                for element in elements:
-                    href = element.get_attribute('href')
-                    text = element.text.strip()
-                    
-                    if href and 'tel:' in href:
-                        phone = href.replace('tel:', '').strip()
-                        if self._is_valid_phone(phone):
-                            contact_data['phone'] = phone
-                            print(f"📱 PHONE FOUND: {phone}")
+        # EMAIL FALLBACK - plain text in the email section
+        if not contact_data['email']:
+            for xpath in self.EMAIL_TEXT_XPATHS:
+                try:
+                    for element in modal.xpath(xpath):
+                        text = _node_text(element)
+                        if text and '@' in text and self._is_valid_email(text):
+                            contact_data['email'] = text
+                            print(f"📧 EMAIL FOUND: {text}")
                             break
-                    elif text and self._is_valid_phone(text):
-                        contact_data['phone'] = text
-                        print(f"📱 PHONE FOUND: {text}")
+                            
+                    if contact_data['email']:
                         break
-                        
-                if contact_data['phone']:
-                    break
-            except Exception:
-                continue
-        
-        # WEBSITE EXTRACTION
-        website_selectors = [
-            "section:nth-child(2) ul li a",
-            "section:nth-child(2) div a",
-            "section div ul li a",
-            "a[href^='http']"
-        ]
+                except Exception:
+                    continue
         
-        for selector in website_selectors:
-            try:
-                elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                for element in elements:
-                    href = element.get_attribute('href')
-                    text = element.text.strip()
-                    
-                    if href and self._is_valid_website(href):
-                        website_data = {
-                            'url': href,
-                            'display_text': text if text else href
-                        }
-                        
-                        if not any(w['url'] == href for w in contact_data['websites']):
-                            contact_data['websites'].append(website_data)
-                            print(f"🌐 WEBSITE FOUND: {href}")
+        # PHONE FALLBACK - plain text in the phone section
+        if not contact_data['phone']:
+            for xpath in self.PHONE_TEXT_XPATHS:
+                try:
+                    for element in modal.xpath(xpath):
+                        text = _node_text(element)
+                        if text and self._is_valid_phone(text):
+                            contact_data['phone'] = text
+                            print(f"📱 PHONE FOUND: {text}")
+                            break
                             
-            except Exception:
-                continue
+                    if contact_data['phone']:
+                        break
+                except Exception:
+                    continue
         
         return contact_data
     
@@ -526,79 +856,101 @@ class ProductionInfoExtractor:
         try:
             print("🔄 Closing contact modal...")
             
-            close_methods = [
-                "button[aria-label*='Dismiss']",
-                "button[aria-label*='Close']", 
-                ".artdeco-modal__dismiss",
-                "button.artdeco-button--circle"
-            ]
+            # ESC closes LinkedIn's modals almost every time - try it before hunting for buttons
+            try:
+                driver.switch_to.active_element.send_keys(Keys.ESCAPE)
+                if self._wait_for_modal_closed(driver, 1):
+                    print("✅ Modal closed with ESC")
+                    return True
+            except Exception:
+                pass
             
-            modal_closed = False
-            for selector in close_methods:
-                try:
-                    elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                    for element in elements:
-                        if element.is_displayed():
-                            element.click()
-                            modal_closed = True
-                            print("✅ Modal closed")
-                            break
-                    if modal_closed:
-                        break
-                except Exception:
-                    continue
+            close_methods = self.CLOSE_BUTTON_SELECTORS
+            if self._last_close_selector:
+                close_methods = sorted(close_methods, key=lambda s: s != self._last_close_selector)
             
-            if not modal_closed:
-                actions = ActionChains(driver)
-                actions.send_keys(Keys.ESCAPE)
-                actions.perform()
-                print("✅ Modal closed with ESC")
+            try:
+                for probe in self._probe_elements(driver, close_methods):
+                    if probe['visible']:
+                        probe['element'].click()
+                        self._last_close_selector = probe['selector']
+                        print("✅ Modal closed")
+                        break
+            except Exception:
+                pass
             
-            time.sleep(2)
+            if not self._wait_for_modal_closed(driver, 5):
+                print("⚠️ Modal still visible after close")
             return True
             
         except Exception as e:
             print(f"❌ Error closing modal: {e}")
             return False
 
+    def _is_modal_visible(self, driver):
+        """Check in one round trip whether any contact modal element is displayed"""
+        return driver.execute_script("""
+            return Array.prototype.some.call(document.querySelectorAll(arguments[0]), function(e) {
+                return !!(e.offsetWidth || e.offsetHeight || e.getClientRects().length);
+            });
+        """, self.MODAL_SELECTOR)
+
+    def _wait_for_modal_closed(self, driver, timeout):
+        """Return True once the contact modal is gone, False if it is still up after timeout"""
+        try:
+            WebDriverWait(driver, timeout, poll_frequency=0.25).until_not(self._is_modal_visible)
+            return True
+        except TimeoutException:
+            return False
+
     def download_profile_picture(self, driver, session, person_folder):
         """Download profile picture"""
-        try:
-            print("🖼️ Downloading profile picture...")
+        print("🖼️ Downloading profile picture...")
+        img_url = self._find_profile_picture_url(driver)
+        if not img_url:
+            return False
+        return self._save_profile_picture(session, img_url, person_folder)
 
+    def _find_profile_picture_url(self, driver):
+        """Locate the profile picture's src in the current page"""
+        try:
             img_selectors = [
                 "img.pv-top-card-profile-picture__image--show",
                 "img.evi-image",
                 "img[alt*='profile']",
             ]
 
-            img_url = None
-            for selector in img_selectors:
-                try:
-                    elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                    for element in elements:
-                        if element.is_displayed():
-                            src = element.get_attribute("src")
-                            if src and "profile" in src:
-                                img_url = src
-                                break
-                    if img_url:
-                        break
-                except:
-                    continue
+            for probe in self._probe_elements(driver, img_selectors):
+                src = probe['src']
+                if probe['visible'] and src and "profile" in src:
+                    return src
 
-            if not img_url:
-                print("⚠️ No profile picture found")
-                return False
+            print("⚠️ No profile picture found")
+            return None
 
-            response = session.get(img_url, timeout=30)
-            response.raise_for_status()
+        except Exception as e:
+            print(f"❌ Profile picture error: {e}")
+            return None
 
-            ext = ".jpg" if "jpg" in response.headers.get("content-type", "") else ".png"
-            img_path = person_folder / f"profile_picture{ext}"
+    def _save_profile_picture(self, session, img_url, person_folder):
+        """Fetch a profile picture over HTTP and write it into the person folder"""
+        try:
+            # Stream straight to disk instead of buffering the whole image in memory
+            with session.get(img_url, timeout=30, stream=True) as response:
+                response.raise_for_status()
+
+                ext = ".jpg" if "jpg" in response.headers.get("content-type", "") else ".png"
+                img_path = person_folder / f"profile_picture{ext}"
+                tmp_path = person_folder / f"profile_picture{ext}.tmp"
 
-            with open(img_path, "wb") as f:
-                f.write(response.content)
+                # Rename into place only once the whole image has arrived
+                try:
+                    with open(tmp_path, "wb") as f:
+                        for chunk in response.iter_content(chunk_size=65536):
+                            f.write(chunk)
+                    os.replace(tmp_path, img_path)
+                finally:
+                    tmp_path.unlink(missing_ok=True)
 
             print(f"✅ Profile picture saved")
             return True
@@ -607,27 +959,54 @@ class ProductionInfoExtractor:
             print(f"❌ Profile picture error: {e}")
             return False
 
-    def _move_downloaded_pdf(self, person_folder):
+    def _discard_download_dir(self, driver):
+        """Remove a retired browser's download directory"""
+        download_dir = self._download_dirs.pop(driver, None)
+        if download_dir:
+            shutil.rmtree(download_dir, ignore_errors=True)
+
+    def _find_downloaded_pdf(self, download_dir):
+        """Pick the downloaded PDF in one directory pass
+        
+        Prefers Profile.pdf, then the newest Profile*.pdf, then the newest *.pdf.
+        """
+        newest_profile, newest_profile_ctime = None, -1
+        newest_any, newest_any_ctime = None, -1
+        
+        with os.scandir(download_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.endswith(".pdf") or not entry.is_file():
+                    continue
+                if name == "Profile.pdf":
+                    return entry.path
+                    
+                ctime = entry.stat().st_ctime
+                if name.startswith("Profile") and ctime > newest_profile_ctime:
+                    newest_profile, newest_profile_ctime = entry.path, ctime
+                if ctime > newest_any_ctime:
+                    newest_any, newest_any_ctime = entry.path, ctime
+                    
+        return newest_profile or newest_any
+
+    def _wait_for_profile_pdf(self, download_dir, timeout=10):
+        """Poll until Chrome finishes the Profile*.pdf download (in-progress files are .crdownload)"""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            with os.scandir(download_dir) as entries:
+                if any(e.name.startswith("Profile") and e.name.endswith(".pdf") for e in entries):
+                    return True
+            time.sleep(0.25)
+        return False
+
+    def _move_downloaded_pdf(self, download_dir, person_folder):
         """Move downloaded PDF"""
         try:
-            pdf_patterns = [
-                self.downloads_dir / "Profile.pdf",
-                list(self.downloads_dir.glob("Profile*.pdf")),
-                list(self.downloads_dir.glob("*.pdf"))
-            ]
-
-            downloaded_pdf = None
-            for pattern in pdf_patterns:
-                if isinstance(pattern, Path) and pattern.exists():
-                    downloaded_pdf = pattern
-                    break
-                elif isinstance(pattern, list) and pattern:
-                    downloaded_pdf = max(pattern, key=os.path.getctime)
-                    break
+            downloaded_pdf = self._find_downloaded_pdf(download_dir)
 
-            if downloaded_pdf and downloaded_pdf.exists():
+            if downloaded_pdf:
                 destination = person_folder / "profile.pdf"
-                shutil.move(str(downloaded_pdf), str(destination))
+                shutil.move(downloaded_pdf, str(destination))
                 print("✅ PDF moved")
                 return True
             else:
@@ -642,9 +1021,10 @@ class ProductionInfoExtractor:
         """Download profile PDF"""
         try:
             print("📄 Downloading PDF...")
+            download_dir = self._download_dirs[driver]
 
-            # Clear old PDFs
-            for pdf in self.downloads_dir.glob("Profile*.pdf"):
+            # Clear PDFs this browser left behind for an earlier profile
+            for pdf in download_dir.glob("*.pdf"):
                 try:
                     pdf.unlink()
                 except:
@@ -656,22 +1036,14 @@ class ProductionInfoExtractor:
             ]
 
             more_button = None
-            for selector in more_selectors:
-                try:
-                    elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                    for element in elements:
-                        if element.is_displayed():
-                            more_button = element
-                            break
-                    if more_button:
-                        break
-                except:
-                    continue
+            for probe in self._probe_elements(driver, more_selectors):
+                if probe['visible']:
+                    more_button = probe['element']
+                    break
 
             if more_button:
                 print("🔘 Clicking More actions...")
                 more_button.click()
-                time.sleep(2)
 
                 pdf_selectors = [
                     "div[role='menuitem']",
@@ -679,17 +1051,23 @@ class ProductionInfoExtractor:
                     ".artdeco-dropdown__item",
                 ]
 
-                for selector in pdf_selectors:
-                    try:
-                        elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                        for element in elements:
-                            if element.is_displayed() and "PDF" in element.text:
-                                print("📄 Clicking PDF option...")
-                                element.click()
-                                time.sleep(5)
-                                return self._move_downloaded_pdf(person_folder)
-                    except:
-                        continue
+                # Poll until the dropdown renders its PDF entry instead of sleeping a fixed 2s
+                def visible_pdf_option(d):
+                    for probe in self._probe_elements(d, pdf_selectors):
+                        if probe['visible'] and "PDF" in probe['text']:
+                            return probe['element']
+                    return False
+
+                try:
+                    pdf_option = WebDriverWait(driver, 5, poll_frequency=0.25).until(visible_pdf_option)
+                except TimeoutException:
+                    pdf_option = None
+
+                if pdf_option:
+                    print("📄 Clicking PDF option...")
+                    pdf_option.click()
+                    self._wait_for_profile_pdf(download_dir)
+                    return self._move_downloaded_pdf(download_dir, person_folder)
 
             return False
 
@@ -702,7 +1080,6 @@ class ProductionInfoExtractor:
         try:
             print(f"🔄 Extracting {content_type}...")
             driver.get(url)
-            time.sleep(5)
             
             if content_type == "posts":
                 content_selectors = [
@@ -717,70 +1094,64 @@ class ProductionInfoExtractor:
                     ".comments-comment-item__main-content"
                 ]
             
+            self._wait_for_page(driver, ", ".join(content_selectors), may_be_empty=True)
+            
             extracted_content = []
             max_scrolls = 20
-            iteration_count = 0
-            previous_content_count = 0
-            no_new_content_count = 0
+            no_growth_count = 0
             
-            while iteration_count < max_scrolls:
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(3)
-                
-                current_elements = []
-                for selector in content_selectors:
-                    try:
-                        elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                        current_elements.extend(elements)
-                    except Exception:
-                        continue
+            for _ in range(max_scrolls):
+                # Scroll and read the page height in one round trip
+                height = driver.execute_script(
+                    "window.scrollTo(0, document.body.scrollHeight); return document.body.scrollHeight;"
+                )
                 
-                current_count = len(current_elements)
-                
-                if current_count == previous_content_count:
-                    no_new_content_count += 1
-                    if no_new_content_count >= 3:
+                # Move on as soon as the feed grows; stop once it has stopped growing twice in a row
+                try:
+                    WebDriverWait(driver, 3, poll_frequency=0.25).until(
+                        lambda d: d.execute_script("return document.body.scrollHeight;") > height
+                    )
+                    no_growth_count = 0
+                except TimeoutException:
+                    no_growth_count += 1
+                    if no_growth_count >= 2:
                         break
-                else:
-                    no_new_content_count = 0
-                
-                previous_content_count = current_count
-                iteration_count += 1
             
-            # Extract final content
-            for selector in content_selectors:
-                try:
-                    elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                    
-                    for element in elements:
-                        try:
-                            content_text = element.get_attribute("innerHTML")
-                            if not content_text:
-                                content_text = element.text
-                            
-                            content_text = re.sub(r"<[^>]+>", "", content_text)
-                            content_text = content_text.strip()
+            # Extract final content - every candidate's text in one round trip, grouped by selector.
+            # textContent is already tag-free and entity-decoded, so nothing is parsed here.
+            texts_by_selector = driver.execute_script("""
+                return arguments[0].map(function(selector) {
+                    return Array.from(document.querySelectorAll(selector)).map(function(e) {
+                        return e.textContent || '';
+                    });
+                });
+            """, content_selectors) or []
+            
+            seen_content = set()
+            for texts in texts_by_selector:
+                for text in texts:
+                    try:
+                        content_text = text.strip()
+                        
+                        if content_text and len(content_text) > 10:
+                            content = content_text[:2000]
+                            if content in seen_content:
+                                continue
+                            seen_content.add(content)
                             
-                            if content_text and len(content_text) > 10:
-                                content_item = {
-                                    "index": len(extracted_content) + 1,
-                                    "type": "original_post" if content_type == "posts" else "comment",
-                                    "content": content_text[:2000],
-                                    "timestamp": None,
-                                    "extracted_at": datetime.now().isoformat()
-                                }
+                            extracted_content.append({
+                                "index": len(extracted_content) + 1,
+                                "type": "original_post" if content_type == "posts" else "comment",
+                                "content": content,
+                                "timestamp": None,
+                                "extracted_at": datetime.now().isoformat()
+                            })
                                 
-                                if not any(item['content'] == content_text[:2000] for item in extracted_content):
-                                    extracted_content.append(content_item)
-                                    
-                        except Exception:
-                            continue
-                    
-                    if extracted_content:
-                        break
-                        
-                except Exception:
-                    continue
+                    except Exception:
+                        continue
+                
+                if extracted_content:
+                    break
             
             print(f"✅ Extracted {len(extracted_content)} {content_type}")
             return extracted_content
@@ -823,19 +1194,29 @@ class ProductionInfoExtractor:
         print(f"🌐 URL: {profile_url}")
         print("="*80)
         
-        # Start fresh browser for this profile
-        driver = self.setup_headless_browser()
+        # Borrow a logged-in browser from the pool
+        driver = self.driver_pool.acquire()
         if not driver:
             print("❌ Failed to setup browser")
             return False
         
-        session = self.setup_requests_session(driver)
-        
+        broken = False
         try:
             # Navigate to profile
             print(f"🌐 Navigating to profile...")
             driver.get(profile_url)
-            time.sleep(5)
+            # Wait for the client-rendered top card itself - readyState fires long before it
+            page_ready = self._wait_for_page(driver, self.TOP_CARD_SELECTOR)
+            if not page_ready:
+                print("⚠️ Profile top card did not render - extracting whatever is on the page")
+            
+            # An expired session lands on /authwall or /login instead of the /in/ profile
+            on_profile = urlsplit(driver.current_url).path.startswith("/in/")
+            if not on_profile:
+                print(f"⚠️ Redirected away from the profile: {driver.current_url}")
+            
+            # Synced after navigation - WebDriver only exposes cookies for the current page's domain
+            session = self.setup_requests_session(driver)
             
             # Extract profile info
             profile_info = self._extract_profile_info(driver, profile_url)
@@ -844,11 +1225,13 @@ class ProductionInfoExtractor:
                 return False
             
             # Create folder
-            clean_name = self._clean_filename(f"{self.next_folder_number}_{profile_info['clean_filename']}")
+            with self._lock:
+                folder_number = self.next_folder_number
+                self.next_folder_number += 1
+            clean_name = self._clean_filename(f"{folder_number}_{profile_info['clean_filename']}")
             person_folder = self.output_dir / clean_name
             person_folder.mkdir(exist_ok=True)
             print(f"📁 Created folder: {clean_name}")
-            self.next_folder_number += 1
             
             # Initialize contact data
             contact_data = {
@@ -866,25 +1249,14 @@ class ProductionInfoExtractor:
                 try:
                     print(f"🔘 Clicking contact button...")
                     contact_button.click()
-                    time.sleep(5)
-                    
-                    # Check if modal opened
-                    modal_indicators = [
-                        'div[role="dialog"]',
-                        '.artdeco-modal',
-                        '.pv-contact-info'
-                    ]
                     
-                    modal_found = False
-                    for indicator in modal_indicators:
-                        try:
-                            modal_elements = driver.find_elements(By.CSS_SELECTOR, indicator)
-                            if any(elem.is_displayed() for elem in modal_elements):
-                                modal_found = True
-                                print("✅ Modal opened")
-                                break
-                        except:
-                            continue
+                    # Wait for modal to open
+                    try:
+                        WebDriverWait(driver, 10, poll_frequency=0.25).until(self._is_modal_visible)
+                        modal_found = True
+                        print("✅ Modal opened")
+                    except TimeoutException:
+                        modal_found = False
                     
                     if modal_found:
                         contact_data = self.extract_contact_info_from_modal(driver)
@@ -899,10 +1271,22 @@ class ProductionInfoExtractor:
             else:
                 print("❌ No contact button found")
             
-            # Download profile picture
+            # Download profile picture - the HTTP fetch runs in the background
+            # while the browser moves on to the PDF and activity pages
             print("🖼️ Downloading profile picture...")
-            picture_success = self.download_profile_picture(driver, session, person_folder)
-            profile_info['extraction_metadata']['profile_picture_downloaded'] = picture_success
+            # Reuse the src read with the profile header before the modal was opened
+            img_url = profile_info['profile_picture_url'] or self._find_profile_picture_url(driver)
+            picture_future = None
+            if img_url and self.download_executor:
+                picture_future = self.download_executor.submit(
+                    self._save_profile_picture, session, img_url, person_folder
+                )
+                self._local.pending_download = picture_future
+                picture_success = False
+            elif img_url:
+                picture_success = self._save_profile_picture(session, img_url, person_folder)
+            else:
+                picture_success = False
 
             # Download PDF
             print("📄 Downloading PDF...")
@@ -919,6 +1303,10 @@ class ProductionInfoExtractor:
             comments_url = f"{profile_url.rstrip('/')}/recent-activity/comments/"
             comments = self.infinite_scroll_and_extract(driver, comments_url, "comments")
             
+            if picture_future:
+                picture_success = picture_future.result()
+            profile_info['extraction_metadata']['profile_picture_downloaded'] = picture_success
+            
             # Mark activity as extracted if we got any content
             if posts or comments:
                 profile_info['extraction_metadata']['activity_extracted'] = True
@@ -933,8 +1321,13 @@ class ProductionInfoExtractor:
                 json_filename = f"{profile_info['clean_filename']}_info.json"
                 json_path = person_folder / json_filename
                 
-                with open(json_path, "w", encoding="utf-8") as f:
-                    json.dump(unified_data, f, indent=2, ensure_ascii=False)
+                _write_json(json_path, unified_data)
+                
+                # Only a genuinely rendered profile is skipped next run; anything else is retried
+                if page_ready and on_profile and profile_info['name'] != "Unknown":
+                    self._mark_seen(profile_url, clean_name)
+                else:
+                    print("⚠️ Profile page incomplete - it will be retried on the next run")
                 
                 print(f"✅ Unified JSON saved: {json_filename}")
             else:
@@ -952,16 +1345,18 @@ class ProductionInfoExtractor:
             print(f"📝 Posts: {len(posts)}")
             print(f"💬 Comments: {len(comments)}")
             
-            self.stats['successful_extractions'] += 1
+            with self._lock:
+                self.stats.successful_extractions += 1
             return True
             
         except Exception as e:
             print(f"❌ Error processing profile: {e}")
-            self.stats['failed_extractions'] += 1
+            broken = True
+            with self._lock:
+                self.stats.failed_extractions += 1
             return False
         finally:
-            driver.quit()
-            print("🔒 Browser closed for this profile")
+            self.driver_pool.release(driver, broken=broken)
 
     def read_profile_links_stream(self):
         """Generator to read profile links one at a time"""
@@ -970,11 +1365,11 @@ class ProductionInfoExtractor:
                 print(f"❌ Profile links file not found: {self.profile_links_file}")
                 return
                 
-            with open(self.profile_links_file, 'r') as f:
-                profile_links = json.load(f)
+            profile_links = _read_json(self.profile_links_file)
                 
-            self.stats['total_profiles'] = len(profile_links)
-            print(f"📊 Found {self.stats['total_profiles']} profiles to process")
+            self.stats.total_profiles = len(profile_links)
+            self.stats.pending_profiles = sum(1 for url in profile_links if url not in self.seen_profiles)
+            print(f"📊 Found {self.stats.total_profiles} profiles, {self.stats.pending_profiles} to process")
             
             for profile_url, profile_name in profile_links.items():
                 yield profile_url, profile_name
@@ -983,7 +1378,39 @@ class ProductionInfoExtractor:
             print(f"❌ Error reading profile links: {e}")
             return
 
-    def run_production_extraction(self):
+    def _wait_for_start_slot(self):
+        """Space profile starts PROFILE_START_INTERVAL apart, however many workers are running"""
+        with self._lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_start)
+            self._next_start = start_at + self.PROFILE_START_INTERVAL
+        if start_at > now:
+            time.sleep(start_at - now)
+
+    def _run_profile(self, profile_url, profile_name):
+        """Process one profile, counting progress and containing fatal errors"""
+        if profile_url in self.seen_profiles:
+            print(f"⏭️ Skipping {profile_name} - already extracted to {self.seen_profiles[profile_url]}")
+            with self._lock:
+                self.stats.skipped_profiles += 1
+            return False
+            
+        with self._lock:
+            self.stats.processed_profiles += 1
+            processed = self.stats.processed_profiles
+        
+        print(f"\n🔄 PROGRESS: {processed}/{self.stats.pending_profiles}")
+        
+        self._wait_for_start_slot()
+        try:
+            return self.process_single_profile(profile_url, profile_name)
+        except Exception as e:
+            print(f"❌ Fatal error processing {profile_name}: {e}")
+            with self._lock:
+                self.stats.failed_extractions += 1
+            return False
+
+    def run_production_extraction(self, max_workers=1):
         """Main production extraction workflow"""
         print("🚀 LinkedIn Info Extractor - PRODUCTION MODE")
         print("🎯 Automated profile processing with headless browser")
@@ -1001,49 +1428,63 @@ class ProductionInfoExtractor:
         
         print("\n✅ Cookies ready - starting automated processing...")
         
-        # Process each profile
-        for profile_url, profile_name in self.read_profile_links_stream():
-            self.stats['processed_profiles'] += 1
-            
-            print(f"\n🔄 PROGRESS: {self.stats['processed_profiles']}/{self.stats['total_profiles']}")
-            
-            try:
-                self.process_single_profile(profile_url, profile_name)
-            except Exception as e:
-                print(f"❌ Fatal error processing {profile_name}: {e}")
-                self.stats['failed_extractions'] += 1
-                continue
-            
-            # Brief pause between profiles
-            print("⏳ Pausing before next profile...")
-            time.sleep(2)
+        # One browser per worker, reused across profiles
+        self.driver_pool = DriverPool(
+            self.setup_headless_browser, size=max_workers, on_discard=self._discard_download_dir
+        )
+        self.download_executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="download")
+        
+        try:
+            if max_workers > 1:
+                # Each worker drives its own headless browser
+                print(f"⚡ Processing with {max_workers} parallel browsers")
+                executor = ThreadPoolExecutor(max_workers=max_workers)
+                try:
+                    for profile_url, profile_name in self.read_profile_links_stream():
+                        executor.submit(self._run_profile, profile_url, profile_name)
+                    executor.shutdown(wait=True)
+                finally:
+                    # On Ctrl+C drop the queued profiles instead of draining them at interpreter exit
+                    executor.shutdown(wait=False, cancel_futures=True)
+            else:
+                # Process each profile (pacing comes from _wait_for_start_slot)
+                for profile_url, profile_name in self.read_profile_links_stream():
+                    self._run_profile(profile_url, profile_name)
+        finally:
+            self.download_executor.shutdown(wait=True)
+            self.download_executor = None
+            self.driver_pool.close_all()
+            print("🔒 Browsers closed")
         
         # Final statistics
         self.show_final_stats()
         
     def show_final_stats(self):
         """Show final processing statistics"""
+        s = self.stats
         end_time = datetime.now()
-        total_time = end_time - self.stats['start_time']
+        total_time = timedelta(seconds=time.monotonic() - s.start_monotonic)
         
         print(f"\n" + "="*80)
         print("🎉 LINKEDIN INFO EXTRACTOR - PRODUCTION COMPLETE")
         print("="*80)
         
         print(f"\n📊 FINAL STATISTICS:")
-        print(f"📅 Start Time: {self.stats['start_time'].strftime('%Y-%m-%d %H:%M:%S')}")
+        print(f"📅 Start Time: {s.start_time.strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"📅 End Time: {end_time.strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"⏱️ Total Time: {total_time}")
-        print(f"👤 Total Profiles: {self.stats['total_profiles']}")
-        print(f"✅ Successful Extractions: {self.stats['successful_extractions']}")
-        print(f"❌ Failed Extractions: {self.stats['failed_extractions']}")
+        print(f"👤 Total Profiles: {s.total_profiles}")
+        print(f"✅ Successful Extractions: {s.successful_extractions}")
+        print(f"❌ Failed Extractions: {s.failed_extractions}")
+        print(f"⏭️ Skipped (already extracted): {s.skipped_profiles}")
         
-        if self.stats['total_profiles'] > 0:
-            success_rate = (self.stats['successful_extractions'] / self.stats['total_profiles']) * 100
+        attempted = s.total_profiles - s.skipped_profiles
+        if attempted > 0:
+            success_rate = (s.successful_extractions / attempted) * 100
             print(f"📈 Success Rate: {success_rate:.1f}%")
             
-            if self.stats['successful_extractions'] > 0:
-                avg_time_per_profile = total_time.total_seconds() / self.stats['successful_extractions']
+            if s.successful_extractions > 0:
+                avg_time_per_profile = total_time.total_seconds() / s.successful_extractions
                 print(f"⚡ Avg Time per Profile: {avg_time_per_profile:.1f} seconds")
         
         print(f"\n📁 All data saved in: {self.output_dir}")
@@ -1052,10 +1493,20 @@ class ProductionInfoExtractor:
 
 def main():
     """Main function"""
+    
+    # CONFIGURABLE PARAMETERS - EASY TO MODIFY
+    MAX_WORKERS = 1  # Number of profiles processed in parallel (1 = sequential)
+    
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+    
     extractor = ProductionInfoExtractor()
     
     try:
-        extractor.run_production_extraction()
+        extractor.run_production_extraction(max_workers=MAX_WORKERS)
     except KeyboardInterrupt:
         print("\n⚠️ Extraction interrupted by user")
     except Exception as e:
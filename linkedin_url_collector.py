@@ -13,7 +13,9 @@ import os
 import random
 import re
 from pathlib import Path
+from urllib.parse import urlsplit
 import logging
+from dataclasses import dataclass
 from datetime import datetime
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -23,8 +25,66 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
 from selenium.webdriver.chrome.service import Service
 
+# Name sanitizing patterns, compiled once at import
+_VIEW_PROFILE_RE = re.compile(r'\n.*View.*profile.*$', re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r'\s+')
+_NAME_UNSAFE_RE = re.compile(r'[^\w\s\-\.\']')
+
+# Analytics/tracking beacons that never carry page content - blocked via CDP
+# (also used by linkedin_info_extractor)
+TRACKER_URL_PATTERNS = [
+    "*linkedin.com/li/track*",
+    "*px.ads.linkedin.com*",
+    "*snap.licdn.com*",
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+]
+
+
+def to_cdp_cookie(cookie):
+    """Convert a Selenium cookie dict into a CDP Network.CookieParam"""
+    param = {
+        "name": cookie["name"],
+        "value": cookie["value"],
+        "domain": cookie.get("domain", ".linkedin.com"),
+        "path": cookie.get("path", "/"),
+        "secure": cookie.get("secure", False),
+        "httpOnly": cookie.get("httpOnly", False),
+    }
+    if "expiry" in cookie:
+        param["expires"] = cookie["expiry"]
+    if cookie.get("sameSite") in ("Strict", "Lax", "None"):
+        param["sameSite"] = cookie["sameSite"]
+    return param
+
+
+@dataclass
+class CollectionStats:
+    """Counters for one collection run"""
+    total_pages_processed: int = 0
+    profiles_found: int = 0
+    duplicates_removed: int = 0
+    unique_profiles: int = 0
+    pagination_successes: int = 0
+    pagination_failures: int = 0
+
 
 class LinkedInURLCollector:
+    # Search results list (LinkedIn obfuscates the class name)
+    RESULTS_LIST_SELECTOR = "ul.ycqHEtWUzSkZHnfXvWPTWXzsHyguohSKGiJViRM"
+    
+    # Result-title profile links inside that list
+    PROFILE_LINK_SELECTOR = f"{RESULTS_LIST_SELECTOR} li .t-16 a[href*='/in/']"
+    
+    # Next page button, in priority order (fixed for every page, so built once)
+    NEXT_BUTTON_SELECTORS = (
+        "button[aria-label='Next']",
+        "button[aria-label*='Next']",
+        ".artdeco-pagination__button--next"
+    )
+    NEXT_BUTTON_UNION = ", ".join(NEXT_BUTTON_SELECTORS)
+    
     def __init__(self, output_dir="linkedin_url_collector"):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
@@ -34,6 +94,12 @@ class LinkedInURLCollector:
         self.cache_file = self.output_dir / "search_url_cache.json"
         self.profile_links_file = self.output_dir / "profile_links.json"
         
+        # Persistent Chrome profile for the visible setup browser (keeps login + HTTP cache)
+        self.chrome_profile_dir = Path.home() / ".linkedin_scraper_profile"
+        
+        # On-disk HTTP/code cache for the headless browser (cookies stay ephemeral)
+        self.browser_cache_dir = Path.home() / ".linkedin_scraper_cache" / "collector"
+        
         # Setup logging
         self._setup_logging()
         
@@ -41,14 +107,7 @@ class LinkedInURLCollector:
         self.all_profile_links = self._load_existing_profile_links()
         
         # Stats tracking
-        self.stats = {
-            'total_pages_processed': 0,
-            'profiles_found': 0,
-            'duplicates_removed': 0,
-            'unique_profiles': 0,
-            'pagination_successes': 0,
-            'pagination_failures': 0
-        }
+        self.stats = CollectionStats()
         
     def _setup_logging(self):
         """Setup logging"""
@@ -78,10 +137,14 @@ class LinkedInURLCollector:
             if self.profile_links_file.exists():
                 with open(self.profile_links_file, 'r') as f:
                     data = json.load(f)
-                    self.logger.info(f"📂 Loaded {len(data)} existing profile links")
-                    return data
+                    # Re-key older files by canonical URL so dedup matches new links
+                    links = {}
+                    for url, name in data.items():
+                        links.setdefault(self._sanitize_url(url) or url, name)
+                    self.logger.info("📂 Loaded %s existing profile links", len(links))
+                    return links
         except Exception as e:
-            self.logger.debug(f"No existing profile links file or error loading: {e}")
+            self.logger.debug("No existing profile links file or error loading: %s", e)
         
         return {}
         
@@ -90,9 +153,9 @@ class LinkedInURLCollector:
         try:
             with open(self.profile_links_file, 'w') as f:
                 json.dump(self.all_profile_links, f, indent=2)
-            self.logger.info(f"💾 Saved {len(self.all_profile_links)} profile links to {self.profile_links_file}")
+            self.logger.info("💾 Saved %s profile links to %s", len(self.all_profile_links), self.profile_links_file)
         except Exception as e:
-            self.logger.error(f"❌ Error saving profile links: {e}")
+            self.logger.error("❌ Error saving profile links: %s", e)
             
     def _sanitize_name(self, raw_name):
         """Sanitize profile name using regex"""
@@ -101,29 +164,34 @@ class LinkedInURLCollector:
             
         # Remove patterns like "View [Name]'s profile" and newlines
         # Pattern matches: \nView [anything]'s profile OR \nView [anything] profile
-        cleaned = re.sub(r'\n.*View.*profile.*$', '', raw_name, flags=re.IGNORECASE)
+        cleaned = _VIEW_PROFILE_RE.sub('', raw_name)
         
         # Remove extra whitespace and newlines
-        cleaned = re.sub(r'\s+', ' ', cleaned).strip()
+        cleaned = _WHITESPACE_RE.sub(' ', cleaned).strip()
         
         # Remove unicode characters like \u2019 (smart apostrophe)
-        cleaned = re.sub(r'[^\w\s\-\.\']', '', cleaned)
+        cleaned = _NAME_UNSAFE_RE.sub('', cleaned)
         
         return cleaned if cleaned else "Unknown"
         
     def _sanitize_url(self, url):
-        """Sanitize LinkedIn profile URL"""
+        """Sanitize LinkedIn profile URL into its canonical form"""
         if not url or '/in/' not in url:
             return None
             
-        # Remove tracking parameters and normalize
-        base_url = url.split('?')[0] if '?' in url else url
-        
         # Ensure it's a valid LinkedIn profile URL
-        if 'linkedin.com/in/' in base_url:
-            return base_url
+        parts = urlsplit(url)
+        host = parts.hostname or ''
+        if host != 'linkedin.com' and not host.endswith('.linkedin.com'):
+            return None
+            
+        # Drop tracking parameters, fragments and trailing slashes so the same
+        # profile always maps to the same key
+        path = parts.path.rstrip('/').lower()
+        if not path.startswith('/in/') or path == '/in':
+            return None
             
-        return None
+        return f"https://www.linkedin.com{path}"
         
     def _add_new_links(self, new_links):
         """Add new links to dictionary, automatically removing duplicates"""
@@ -138,7 +206,7 @@ class LinkedInURLCollector:
             else:
                 duplicates_count += 1
                 
-        self.stats['duplicates_removed'] += duplicates_count
+        self.stats.duplicates_removed += duplicates_count
         return new_count
         
     def check_existing_cookies(self):
@@ -157,7 +225,7 @@ class LinkedInURLCollector:
                 if timestamp:
                     cookie_time = datetime.fromisoformat(timestamp)
                     age_days = (datetime.now() - cookie_time).days
-                    self.logger.info(f"🍪 Found cookies from {age_days} days ago")
+                    self.logger.info("🍪 Found cookies from %s days ago", age_days)
                 
                 return True
             else:
@@ -165,7 +233,7 @@ class LinkedInURLCollector:
                 return False
                 
         except Exception as e:
-            self.logger.debug(f"Error checking cookies: {e}")
+            self.logger.debug("Error checking cookies: %s", e)
             return False
             
     def get_search_url_from_user(self):
@@ -216,6 +284,10 @@ class LinkedInURLCollector:
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option('useAutomationExtension', False)
         
+        # Reuse the saved browser profile so an earlier login (and HTTP cache) survives
+        options.add_argument(f'--user-data-dir={self.chrome_profile_dir}')
+        options.add_argument('--profile-directory=Default')
+        
         service = Service("./chromedriver")
         driver = webdriver.Chrome(service=service, options=options)
         
@@ -226,13 +298,12 @@ class LinkedInURLCollector:
             # Navigate to LinkedIn
             print("🌐 Opening LinkedIn...")
             driver.get("https://www.linkedin.com")
-            time.sleep(2)
             
             # Wait for user to complete everything
             print("\n" + "="*60)
             print("⏳ PLEASE COMPLETE ALL STEPS:")
             print("="*60)
-            print("🔐 1. Log in to LinkedIn")
+            print("🔐 1. Log in to LinkedIn (skip if already logged in)")
             print("🔍 2. Go to search page")
             print("🔤 3. Search for your keyword (e.g., 'author')")
             print("🔘 4. Set filters (All filters → 2nd connections → United States)")
@@ -273,7 +344,7 @@ class LinkedInURLCollector:
             return current_url
             
         except Exception as e:
-            self.logger.error(f"❌ Error in manual setup: {e}")
+            self.logger.error("❌ Error in manual setup: %s", e)
             return None
         finally:
             driver.quit()
@@ -302,76 +373,115 @@ class LinkedInURLCollector:
             options.add_experimental_option("excludeSwitches", ["enable-automation"])
             options.add_experimental_option('useAutomationExtension', False)
             
+            # Only links and names are read - skip images and background browser chatter.
+            # Stylesheets stay on because button visibility checks depend on layout.
+            options.add_argument('--blink-settings=imagesEnabled=false')
+            options.add_argument('--disable-gpu')
+            options.add_argument('--disable-notifications')
+            options.add_argument('--disable-background-networking')
+            options.add_argument('--disable-features=TranslateUI')
+            options.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.default_content_setting_values.notifications": 2,
+            })
+            
+            # Keep LinkedIn's JS/CSS cached between runs
+            options.add_argument(f'--disk-cache-dir={self.browser_cache_dir}')
+            options.add_argument('--disk-cache-size=536870912')
+            
             service = Service("./chromedriver")
             driver = webdriver.Chrome(service=service, options=options)
             
             # Anti-detection scripts
             driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
             
-            # Navigate to LinkedIn first
-            driver.get("https://www.linkedin.com")
-            time.sleep(1)
-            
-            # Add cookies
-            for cookie in cookie_data['cookies']:
-                try:
-                    driver.add_cookie(cookie)
-                except Exception as e:
-                    self.logger.debug(f"Could not add cookie: {e}")
+            # Drop tracking requests before they reach the network
+            try:
+                driver.execute_cdp_cmd('Network.enable', {})
+                driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': TRACKER_URL_PATTERNS})
+            except Exception as e:
+                self.logger.debug("Could not block tracking URLs: %s", e)
+            
+            # Set every cookie in one CDP call - no need to load linkedin.com first
+            try:
+                driver.execute_cdp_cmd('Network.setCookies', {
+                    'cookies': [to_cdp_cookie(c) for c in cookie_data['cookies']]
+                })
+            except Exception as e:
+                self.logger.debug("CDP cookie import failed, falling back to add_cookie: %s", e)
+                driver.get("https://www.linkedin.com")
+                for cookie in cookie_data['cookies']:
+                    try:
+                        driver.add_cookie(cookie)
+                    except Exception as e:
+                        self.logger.debug("Could not add cookie: %s", e)
                     
             # Navigate to search URL
-            self.logger.info(f"🌐 Navigating to search URL: {search_url}")
+            self.logger.info("🌐 Navigating to search URL: %s", search_url)
             driver.get(search_url)
-            time.sleep(3)
+            self._wait_for_results(driver)
             
             return driver
             
         except Exception as e:
-            self.logger.error(f"❌ Error setting up headless browser: {e}")
+            self.logger.error("❌ Error setting up headless browser: %s", e)
             return None
             
+    def _wait_for_results(self, driver, timeout=15):
+        """Wait until the search results list is rendered"""
+        try:
+            WebDriverWait(driver, timeout).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, f"{self.RESULTS_LIST_SELECTOR} li"))
+            )
+            return True
+        except TimeoutException:
+            self.logger.warning("⚠️ Search results did not appear within %ss", timeout)
+            return False
+            
     def extract_profile_links_from_page(self, driver, page_number):
         """Extract profile links from current page"""
         try:
-            self.logger.info(f"🔍 Extracting profile links from page {page_number}")
+            self.logger.info("🔍 Extracting profile links from page %s", page_number)
             
             page_links = []
             
-            # CSS selector for profile links
-            for i in range(1, 11):  # LinkedIn shows 10 profiles per page
+            seen_urls = set()
+            
+            # Hrefs and names for every result-title profile link in a single round trip
+            links = driver.execute_script("""
+                return Array.from(document.querySelectorAll(arguments[0])).map(function(a) {
+                    return {href: a.href, text: (a.innerText || '').trim()};
+                });
+            """, self.PROFILE_LINK_SELECTOR) or []
+            
+            for i, link in enumerate(links, 1):
                 try:
-                    selector = f"ul.ycqHEtWUzSkZHnfXvWPTWXzsHyguohSKGiJViRM li:nth-child({i}) .t-16 a"
-                    
-                    profile_links = driver.find_elements(By.CSS_SELECTOR, selector)
-                    
-                    for link in profile_links:
-                        href = link.get_attribute("href")
-                        if href and '/in/' in href:
-                            raw_name = link.text.strip()
-                            clean_name = self._sanitize_name(raw_name)
-                            sanitized_url = self._sanitize_url(href)
-                            
-                            if sanitized_url and clean_name:
-                                page_links.append({
-                                    'name': clean_name,
-                                    'url': sanitized_url
-                                })
-                                self.logger.debug(f"📋 Profile {i}: {clean_name} - {sanitized_url}")
-                                break
-                                
+                    sanitized_url = self._sanitize_url(link['href'])
+                    if not sanitized_url or sanitized_url in seen_urls:
+                        continue
+                        
+                    clean_name = self._sanitize_name(link['text'])
+                    if clean_name:
+                        seen_urls.add(sanitized_url)
+                        page_links.append({
+                            'name': clean_name,
+                            'url': sanitized_url
+                        })
+                        self.logger.debug("📋 Profile %s: %s - %s", i, clean_name, sanitized_url)
+                        
                 except Exception as e:
-                    self.logger.debug(f"❌ Error extracting profile {i}: {e}")
+                    self.logger.debug("❌ Error extracting profile %s: %s", i, e)
                     continue
             
             profiles_found = len(page_links)
-            self.stats['profiles_found'] += profiles_found
+            self.stats.profiles_found += profiles_found
             
             print(f"✅ Found {profiles_found} profiles on page {page_number}")
             
             return page_links
             
         except Exception as e:
-            self.logger.error(f"❌ Error extracting profile links from page {page_number}: {e}")
+            self.logger.error("❌ Error extracting profile links from page %s: %s", page_number, e)
             return []
             
     def click_next_page(self, driver):
@@ -379,48 +489,56 @@ class LinkedInURLCollector:
         try:
             self.logger.info("📄 Looking for Next page button...")
             
-            # Scroll to bottom to find pagination
+            # Scroll to bottom and wait for the lazily rendered pagination
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(random.uniform(1, 2))
-            
-            # Try to find and click next page button
-            next_button_selectors = [
-                "button[aria-label='Next']",
-                "button[aria-label*='Next']",
-                ".artdeco-pagination__button--next"
-            ]
-            
-            for selector in next_button_selectors:
-                try:
-                    next_buttons = driver.find_elements(By.CSS_SELECTOR, selector)
-                    for button in next_buttons:
-                        if button.is_displayed() and button.is_enabled():
-                            self.logger.info(f"🔘 Clicking next page button...")
-                            
-                            # Scroll button into view and click
-                            driver.execute_script("arguments[0].scrollIntoView(true);", button)
-                            time.sleep(random.uniform(0.5, 1))
-                            button.click()
-                            
-                            # Wait for page load (shorter wait time)
-                            page_load_wait = random.uniform(2, 4)
-                            self.logger.info(f"⏳ Waiting {page_load_wait:.1f}s for next page to load...")
-                            time.sleep(page_load_wait)
-                            
-                            self.stats['pagination_successes'] += 1
-                            return True
-                            
-                except Exception as e:
-                    self.logger.debug(f"Next button selector failed: {e}")
-                    continue
+            try:
+                WebDriverWait(driver, 5).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, self.NEXT_BUTTON_UNION))
+                )
+            except TimeoutException:
+                pass
+            
+            # One script finds the first visible, enabled button (in selector priority order),
+            # scrolls it into view and reports the current URL and first result
+            found = driver.execute_script("""
+                var first = document.querySelector(arguments[1]);
+                for (const selector of arguments[0]) {
+                    for (const b of document.querySelectorAll(selector)) {
+                        if ((b.offsetWidth || b.offsetHeight || b.getClientRects().length) && !b.disabled) {
+                            b.scrollIntoView(true);
+                            return {button: b, url: location.href, first_href: first ? first.href : null};
+                        }
+                    }
+                }
+                return null;
+            """, list(self.NEXT_BUTTON_SELECTORS), self.PROFILE_LINK_SELECTOR)
+            
+            if found:
+                self.logger.info("🔘 Clicking next page button...")
+                found['button'].click()
+                
+                # LinkedIn updates the URL before it swaps the results list, so also wait
+                # until the first result is a different profile than on the previous page
+                self.logger.info("⏳ Waiting for next page to load...")
+                WebDriverWait(driver, 15).until(EC.url_changes(found['url']))
+                WebDriverWait(driver, 15, poll_frequency=0.25).until(lambda d: d.execute_script(
+                    "var a = document.querySelector(arguments[0]); return a ? a.href : null;",
+                    self.PROFILE_LINK_SELECTOR
+                ) not in (None, found['first_href']))
+                
+                # Short randomized pause to keep a human-like request rate
+                time.sleep(random.uniform(1, 2))
+                
+                self.stats.pagination_successes += 1
+                return True
             
             self.logger.warning("⚠️ Could not find next page button")
-            self.stats['pagination_failures'] += 1
+            self.stats.pagination_failures += 1
             return False
             
         except Exception as e:
-            self.logger.error(f"❌ Error clicking next page button: {e}")
-            self.stats['pagination_failures'] += 1
+            self.logger.error("❌ Error clicking next page button: %s", e)
+            self.stats.pagination_failures += 1
             return False
             
     def collect_urls_automated(self, search_url, max_pages=5):
@@ -456,7 +574,7 @@ class LinkedInURLCollector:
                     # Save progress after each page
                     self._save_profile_links()
                     
-                    self.stats['total_pages_processed'] += 1
+                    self.stats.total_pages_processed += 1
                     
                     # Move to next page (if not the last page)
                     if current_page < max_pages:
@@ -472,31 +590,31 @@ class LinkedInURLCollector:
                         current_page += 1  # Exit loop
                         
                 except Exception as e:
-                    self.logger.error(f"❌ Error processing page {current_page}: {e}")
+                    self.logger.error("❌ Error processing page %s: %s", current_page, e)
                     current_page += 1
                     continue
             
             # Final save
             self._save_profile_links()
-            self.stats['unique_profiles'] = len(self.all_profile_links)
+            self.stats.unique_profiles = len(self.all_profile_links)
             
             # Print final results
             print(f"\n" + "="*70)
             print(f"🎉 URL COLLECTION COMPLETE!")
             print(f"📊 FINAL STATS:")
-            print(f"📄 Pages Processed: {self.stats['total_pages_processed']}")
-            print(f"🔍 Total Profiles Found: {self.stats['profiles_found']}")
-            print(f"🔄 Duplicates Removed: {self.stats['duplicates_removed']}")
-            print(f"🌟 Unique Profiles in Dictionary: {self.stats['unique_profiles']}")
-            print(f"📄 Pagination Successes: {self.stats['pagination_successes']}")
-            print(f"📄 Pagination Failures: {self.stats['pagination_failures']}")
+            print(f"📄 Pages Processed: {self.stats.total_pages_processed}")
+            print(f"🔍 Total Profiles Found: {self.stats.profiles_found}")
+            print(f"🔄 Duplicates Removed: {self.stats.duplicates_removed}")
+            print(f"🌟 Unique Profiles in Dictionary: {self.stats.unique_profiles}")
+            print(f"📄 Pagination Successes: {self.stats.pagination_successes}")
+            print(f"📄 Pagination Failures: {self.stats.pagination_failures}")
             print(f"📁 Output File: {self.profile_links_file}")
             print("="*70)
             
             return True
             
         except Exception as e:
-            self.logger.error(f"❌ Error in automated collection: {e}")
+            self.logger.error("❌ Error in automated collection: %s", e)
             return False
         finally:
             driver.quit()